@@ -1,21 +1,100 @@
 from fpdf import FPDF
-from datetime import datetime
-import pandas as pd
-from reportlab.platypus import Table, TableStyle, Spacer
-from reportlab.lib import colors
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import repeat
+import threading
+import time
+import uuid
+
+# "Generated on" timestamp, e.g. 15 October 2026, 09:30 PM
+_TS_FMT = '%d %B %Y, %I:%M %p'
+
+# Shared workers for background report builds, created on first use
+_POOL = None
+_POOL_LOCK = threading.Lock()
+
+# Salary slip components shown in the breakup table, with their defaults
+_DEFAULT_EARNINGS = {'basic': 0, 'hra': 0, 'medical_allowance': 0, 'bonus': 0}
+_DEFAULT_DEDUCTIONS = {'tds': 0, 'professional_tax': 0}
+
+
+def _report_pool():
+    """Return the background report executor, creating it on first use"""
+    global _POOL
+    with _POOL_LOCK:
+        if _POOL is None:
+            _POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix='report')
+        return _POOL
+
+
+@lru_cache(maxsize=4096)
+def _rs(amount, places=0):
+    """Format a rupee amount, e.g. Rs2,500,000"""
+    return f"Rs{amount:,.{places}f}"
 
 
 class LoanReportPDF(FPDF):
     """Custom PDF class for loan analysis reports"""
     
+    # Content-stream operators of the page header, keyed by the layout state they depend on
+    _HEADER_CACHE = {}
+    
     def __init__(self):
         super().__init__()
+        # Grows in place (amortised) rather than recopying a str on every line
+        self.buffer = bytearray()
         self.set_auto_page_break(auto=True, margin=15)
     
+    def output(self, name='', dest=''):
+        """Output the PDF, writing the byte buffer straight to disk when saving a file"""
+        dest = dest.upper()
+        if self.state < 3:
+            self.close()
+        if name and dest in ('', 'F'):
+            with open(name, 'wb') as f:
+                f.write(self.buffer)
+            return ''
+        if dest in ('', 'I', 'D', 'S'):
+            document = self.buffer.decode('latin1')
+            if dest == 'S':
+                return document
+            print(document)
+            return ''
+        return super().output(name, dest)
+    
+    def _out(self, s):
+        """Add a line to the current page, or to the document byte buffer once pages are closed"""
+        if self.state == 2:
+            super()._out(s)
+            return
+        if isinstance(s, str):
+            s = s.encode('latin1')
+        elif not isinstance(s, (bytes, bytearray)):
+            s = str(s).encode('latin1')
+        self.buffer += s
+        self.buffer += b'\n'
+    
+    def normalize_text(self, txt):
+        """Replace characters the latin-1 core fonts cannot encode with '?'"""
+        if self.unifontsubset or not isinstance(txt, str) or txt.isascii():
+            return txt
+        return txt.encode('latin1', 'replace').decode('latin1')
+    
     def header(self):
         """Page header"""
         self.set_font('Arial', 'B', 16)
-        self.cell(0, 10, 'LOAN APPLICATION ANALYSIS REPORT', 0, 1, 'C')
+        key = (self.w, self.h, self.k, self.x, self.y, self.r_margin, self.c_margin,
+               self.current_font['i'], self.color_flag and self.text_color)
+        stream = self._HEADER_CACHE.get(key)
+        if stream is None:
+            start = len(self.pages[self.page])
+            self.cell(0, 10, 'LOAN APPLICATION ANALYSIS REPORT', 0, 1, 'C')
+            self._HEADER_CACHE[key] = self.pages[self.page][start:-1]
+        else:
+            self._out(stream)
+            self.x = self.l_margin
+            self.y += 10
+            self.lasth = 10
         self.ln(5)
     
     def footer(self):
@@ -35,28 +114,130 @@ class LoanReportPDF(FPDF):
     
     def add_field(self, label, value):
         """Add a labeled field"""
-        self.set_font('Arial', 'B', 10)
-        self.cell(70, 7, f"{label}:", 0, 0)
-        self.set_font('Arial', '', 10)
-        self.multi_cell(0, 7, str(value))
+        self.add_fields([(label, value)])
+    
+    def add_fields(self, pairs):
+        """Add a block of labeled fields"""
+        for label, value in pairs:
+            self._use_font('B', 10)
+            self.cell(70, 7, f"{label}:", 0, 0)
+            self._use_font('', 10)
+            self.multi_cell(0, 7, str(value))
+    
+    def _use_font(self, style, size):
+        """Select an Arial variant, emitting a font operator only when the selection changes"""
+        font = self.fonts.get('helvetica' + style)
+        if font is None or self.font_family != 'helvetica':
+            # First use in this document (or another family is active): let fpdf load it
+            self.set_font('Arial', style, size)
+            return
+        if self.current_font is font and self.font_size_pt == size:
+            return
+        self.font_style = style
+        self.font_size_pt = size
+        self.font_size = size / self.k
+        self.current_font = font
+        self.underline = 0
+        self._out('BT /F%d %.2f Tf ET' % (font['i'], size))
+    
+    def fast_multi_cell(self, w, h, txt):
+        """multi_cell that skips fpdf's per-character wrap scan when the text fits on one line"""
+        txt = self.normalize_text(txt)
+        if not self.unifontsubset and '\n' not in txt and '\r' not in txt:
+            width = w or self.w - self.r_margin - self.x
+            text_w = sum(map(self.current_font['cw'].get, txt, repeat(0)))
+            if text_w <= (width - 2 * self.c_margin) * 1000.0 / self.font_size:
+                self.cell(width, h, txt, 0, 1)
+                return
+        self.multi_cell(w, h, txt)
+    
+    def _render_checklist(self, items, empty_msg, numbered=True, font_size=10, line_h=6, spacing=0):
+        """Render outstanding items one per line, or a green all-clear message if there are none"""
+        if items:
+            self.set_font('Arial', '', font_size)
+            for i, item in enumerate(items, 1):
+                self.fast_multi_cell(0, line_h, f"{i}. {item}" if numbered else item)
+                if spacing:
+                    self.ln(spacing)
+        else:
+            self.set_font('Arial', 'B', 10)
+            self.set_text_color(0, 128, 0)
+            self.cell(0, 7, empty_msg, 0, 1)
+            self.set_text_color(0, 0, 0)
     
     def add_table(self, headers, data, col_widths=None):
         """Add a table to the PDF"""
         if not col_widths:
             col_widths = [190 / len(headers)] * len(headers)
         
+        self.fast_grid(col_widths, headers, data, row_h=7, align='L', header_fill=(200, 220, 255))
+        self.ln(3)
+    
+    def fast_grid(self, col_widths, headers, rows, header_h=8, row_h=8, align='R', header_fill=(220, 220, 220)):
+        """Draw a bordered table, emitting each page's rows as one content-stream block"""
+        fill = '%.3f %.3f %.3f rg' % tuple(c / 255.0 for c in header_fill)
         self.set_font('Arial', 'B', 9)
-        self.set_fill_color(200, 220, 255)
-        for i, header in enumerate(headers):
-            self.cell(col_widths[i], 8, header, 1, 0, 'C', True)
-        self.ln()
+        if not self._grid_block(col_widths, [headers], header_h, 'C', 'B', fill):
+            self.add_page(self.cur_orientation)
+            self._grid_block(col_widths, [headers], header_h, 'C', 'B', fill, force=True)
         
         self.set_font('Arial', '', 8)
-        for row in data:
-            for i, cell in enumerate(row):
-                self.cell(col_widths[i], 7, str(cell), 1, 0, 'L')
-            self.ln()
-        self.ln(3)
+        rows = [[str(cell) for cell in row] for row in rows]
+        fresh_page = False
+        while rows:
+            drawn = self._grid_block(col_widths, rows, row_h, align, 'S', force=fresh_page)
+            rows = rows[drawn:]
+            if rows:
+                self.add_page(self.cur_orientation)
+                fresh_page = True
+    
+    def _grid_block(self, col_widths, rows, row_h, align, op, fill=None, force=False):
+        """Emit as many grid rows as fit on the current page; returns the row count drawn"""
+        k = self.k
+        x0 = self.x
+        y = self.y
+        rects = []
+        texts = []
+        last_x = last_y = 0
+        drawn = 0
+        for row in rows:
+            # On a fresh page an oversized row is drawn anyway and overflows, as cell() does
+            if y + row_h > self.page_break_trigger and not (force and drawn == 0):
+                break
+            x = x0
+            ty = round((self.h - (y + .5 * row_h + .3 * self.font_size)) * k, 2)
+            for w, txt in zip(col_widths, row):
+                rects.append('%.2f %.2f %.2f %.2f re' % (x * k, (self.h - y) * k, w * k, -row_h * k))
+                txt = self.normalize_text(txt)
+                if txt:
+                    if align == 'R':
+                        dx = w - self.c_margin - self.get_string_width(txt)
+                    elif align == 'C':
+                        dx = (w - self.get_string_width(txt)) / 2.0
+                    else:
+                        dx = self.c_margin
+                    tx = round((x + dx) * k, 2)
+                    texts.append('%.2f %.2f Td (%s) Tj' % (tx - last_x, ty - last_y, self._escape(txt)))
+                    last_x, last_y = tx, ty
+                x += w
+            y += row_h
+            drawn += 1
+        
+        if drawn:
+            chunks = ['q', '\n'.join(rects), op]
+            if fill:
+                # Scoped by q/Q, so the document's fill state is never touched
+                chunks.insert(1, fill)
+            if fill or self.color_flag:
+                chunks.append(self.text_color)
+            if texts:
+                chunks += ['BT', '\n'.join(texts), 'ET']
+            chunks.append('Q')
+            self._out('\n'.join(chunks))
+            self.x = x0
+            self.y = y
+            self.lasth = row_h
+        return drawn
 
 
 class ReportGenerator:
@@ -65,6 +246,18 @@ class ReportGenerator:
     def __init__(self):
         pass
     
+    def generate_report_async(self, applicant_data, salary_analysis, eligibility_results,
+                              obligations, pending_docs, pending_forms, queries,
+                              output_filename=None, bank_statement_data=None):
+        """Build the report on a background thread; returns a Future resolving to the filename"""
+        if output_filename is None:
+            # Concurrent builds must never share the synchronous default filename
+            output_filename = f"loan_analysis_report_{uuid.uuid4().hex}.pdf"
+        return _report_pool().submit(
+            self.generate_report, applicant_data, salary_analysis, eligibility_results,
+            obligations, pending_docs, pending_forms, queries, output_filename, bank_statement_data
+        )
+    
     def generate_report(self, applicant_data, salary_analysis, eligibility_results, 
                        obligations, pending_docs, pending_forms, queries, 
                        output_filename="loan_analysis_report.pdf", bank_statement_data=None):
@@ -73,17 +266,18 @@ class ReportGenerator:
         pdf.add_page()
         
         pdf.set_font('Arial', 'I', 9)
-        pdf.cell(0, 5, f"Generated on: {datetime.now().strftime('%d %B %Y, %I:%M %p')}", 0, 1, 'R')
+        pdf.cell(0, 5, f"Generated on: {time.strftime(_TS_FMT)}", 0, 1, 'R')
         pdf.ln(5)
         
         pdf.section_title('DOCUMENTS UPLOADED')
         
         if pending_docs.get('uploaded_documents_details'):
             for doc in pending_docs['uploaded_documents_details']:
-                pdf.set_font('Arial', 'B', 10)
+                pdf._use_font('B', 10)
                 pdf.cell(0, 6, f"- {doc['document_type']}", 0, 1)
-                pdf.set_font('Arial', '', 9)
                 
+                if 'period' in doc or doc.get('warning'):
+                    pdf._use_font('', 9)
                 if 'period' in doc:
                     pdf.cell(10)
                     pdf.cell(0, 5, f"  Period: {doc.get('period_start', 'N/A')} to {doc.get('period_end', 'N/A')} ({doc['period']})", 0, 1)
@@ -97,23 +291,27 @@ class ReportGenerator:
         
         pdf.section_title('1. APPLICANT SUMMARY')
         
-        pdf.add_field('Applicant Name', applicant_data.get('applicant_name', 'N/A'))
-        pdf.add_field('PAN', applicant_data.get('pan_masked', 'N/A'))
-        pdf.add_field('Aadhar', applicant_data.get('aadhar_masked', 'N/A'))
-        pdf.add_field('Date of Birth', applicant_data.get('date_of_birth', 'N/A'))
-        pdf.add_field('Current Age', f"{applicant_data.get('current_age', 'N/A')} years")
-        pdf.add_field('Mobile Number', applicant_data.get('mobile_no', 'N/A'))
-        pdf.add_field('Email ID', applicant_data.get('email_id', 'N/A'))
-        pdf.add_field('Current Address', applicant_data.get('current_address', 'N/A'))
+        pdf.add_fields([
+            ('Applicant Name', applicant_data.get('applicant_name', 'N/A')),
+            ('PAN', applicant_data.get('pan_masked', 'N/A')),
+            ('Aadhar', applicant_data.get('aadhar_masked', 'N/A')),
+            ('Date of Birth', applicant_data.get('date_of_birth', 'N/A')),
+            ('Current Age', f"{applicant_data.get('current_age', 'N/A')} years"),
+            ('Mobile Number', applicant_data.get('mobile_no', 'N/A')),
+            ('Email ID', applicant_data.get('email_id', 'N/A')),
+            ('Current Address', applicant_data.get('current_address', 'N/A')),
+        ])
         pdf.ln(3)
         
-        pdf.add_field('Employment Type', 'Salaried')
-        pdf.add_field('Employer/Company', applicant_data.get('employer', 'N/A'))
-        pdf.add_field('Designation', applicant_data.get('designation', 'N/A'))
-        pdf.add_field('Department', applicant_data.get('department', 'N/A'))
-        pdf.add_field('Job Since', applicant_data.get('job_since', 'N/A'))
-        pdf.add_field('Total Experience', applicant_data.get('total_experience', 'N/A'))
-        pdf.add_field('Office Address', applicant_data.get('office_address', 'N/A'))
+        pdf.add_fields([
+            ('Employment Type', 'Salaried'),
+            ('Employer/Company', applicant_data.get('employer', 'N/A')),
+            ('Designation', applicant_data.get('designation', 'N/A')),
+            ('Department', applicant_data.get('department', 'N/A')),
+            ('Job Since', applicant_data.get('job_since', 'N/A')),
+            ('Total Experience', applicant_data.get('total_experience', 'N/A')),
+            ('Office Address', applicant_data.get('office_address', 'N/A')),
+        ])
         pdf.ln(5)
         
         # === 2. COMPLETE SALARY BREAKUP (Last 3 Months) ===
@@ -122,41 +320,30 @@ class ReportGenerator:
         slips = salary_analysis.get("salary_slips", [])
 
         if slips and len(slips) > 0:
-        	
-        	# ---- TABLE COLUMN SETTINGS ----
+            # ---- TABLE COLUMN SETTINGS ----
             col_widths = [22, 20, 20, 20, 20, 25, 18, 18, 25]  # fits on A4 width
             headers = ["Month", "Basic", "HRA", "Medical", "Bonus", "Gross", "TDS", "Prof. Tax", "Net"]
 
-            # ---- HEADER ----
-            pdf.set_font("Arial", "B", 9)
-            pdf.set_fill_color(220, 220, 220)
-
-            for w, h in zip(col_widths, headers):
-               pdf.cell(w, 8, h, 1, 0, "C", True)
-            pdf.ln(8)
-
             # ---- ROWS ----
-            pdf.set_font("Arial", "", 8)
-
+            data = []
             for slip in slips[:3]:
-                   month = slip.get("month", "N/A")
-                   earnings = slip.get("earnings", {})
-                   deductions = slip.get("deductions", {})
+                month = slip.get("month", "N/A")
+                earnings = {**_DEFAULT_EARNINGS, **slip.get("earnings", {})}
+                deductions = {**_DEFAULT_DEDUCTIONS, **slip.get("deductions", {})}
 
-                   data = [
-             month,
-            f"{earnings.get('basic', 0):,.0f}",
-            f"{earnings.get('hra', 0):,.0f}",
-            f"{earnings.get('medical_allowance', 0):,.0f}",
-            f"{earnings.get('bonus', 0):,.0f}",
-            f"{slip.get('gross_salary', 0):,.0f}",
-            f"{deductions.get('tds', 0):,.0f}",
-            f"{deductions.get('professional_tax', 0):,.0f}",
-            f"{slip.get('net_salary', 0):,.0f}",
-        ]
-                   for w, d in zip(col_widths, data):
-                       pdf.cell(w, 8, d, 1, 0, "R")
-                   pdf.ln(8)
+                data.append([
+                    month,
+                    f"{earnings['basic']:,.0f}",
+                    f"{earnings['hra']:,.0f}",
+                    f"{earnings['medical_allowance']:,.0f}",
+                    f"{earnings['bonus']:,.0f}",
+                    f"{slip.get('gross_salary', 0):,.0f}",
+                    f"{deductions['tds']:,.0f}",
+                    f"{deductions['professional_tax']:,.0f}",
+                    f"{slip.get('net_salary', 0):,.0f}",
+                ])
+
+            pdf.fast_grid(col_widths, headers, data)
 
         else:
            pdf.set_font("Arial", "I", 9)
@@ -168,25 +355,33 @@ class ReportGenerator:
         
         calculations = eligibility_results.get('calculations', {})
         
-        pdf.add_field('Requested Loan Amount', f"Rs{applicant_data.get('loan_amount', 0):,.0f}")
-        pdf.add_field('Tenure (Auto-calculated based on age)', f"{calculations.get('approved_tenure_years', 'N/A')} years")
-        pdf.add_field('Interest Rate', f"{applicant_data.get('interest_rate', 8.5)}% p.a.")
+        pdf.add_fields([
+            ('Requested Loan Amount', _rs(applicant_data.get('loan_amount', 0))),
+            ('Tenure (Auto-calculated based on age)', f"{calculations.get('approved_tenure_years', 'N/A')} years"),
+            ('Interest Rate', f"{applicant_data.get('interest_rate', 8.5)}% p.a."),
+        ])
         pdf.ln(2)
         
-        pdf.add_field('Current Age', f"{calculations.get('current_age', 'N/A')} years")
-        pdf.add_field('Maximum Age Limit', '60 years')
-        pdf.add_field('Remaining Service Years', f"{calculations.get('remaining_service_years', 'N/A')} years")
-        pdf.add_field('Maximum Tenure Allowed', f"{calculations.get('max_tenure_allowed', 'N/A')} years")
+        pdf.add_fields([
+            ('Current Age', f"{calculations.get('current_age', 'N/A')} years"),
+            ('Maximum Age Limit', '60 years'),
+            ('Remaining Service Years', f"{calculations.get('remaining_service_years', 'N/A')} years"),
+            ('Maximum Tenure Allowed', f"{calculations.get('max_tenure_allowed', 'N/A')} years"),
+        ])
         pdf.ln(2)
         
-        pdf.add_field('Current FOIR (before new loan)', f"{calculations.get('current_foir_percent', 0):.2f}%")
-        pdf.add_field('FOIR with Requested Loan', f"{calculations.get('foir_with_requested_loan', 0):.2f}%")
-        pdf.add_field('Maximum FOIR Allowed', '60.00%')
+        pdf.add_fields([
+            ('Current FOIR (before new loan)', f"{calculations.get('current_foir_percent', 0):.2f}%"),
+            ('FOIR with Requested Loan', f"{calculations.get('foir_with_requested_loan', 0):.2f}%"),
+            ('Maximum FOIR Allowed', '60.00%'),
+        ])
         pdf.ln(2)
         
-        pdf.add_field('EMI for Requested Loan', f"Rs{calculations.get('emi_for_requested_loan', 0):,.2f}")
-        pdf.add_field('Maximum EMI Capacity', f"Rs{calculations.get('max_emi_allowed', 0):,.2f}")
-        pdf.add_field('Maximum Loan by Income', f"Rs{calculations.get('max_loan_by_income', 0):,.2f}")
+        pdf.add_fields([
+            ('EMI for Requested Loan', _rs(calculations.get('emi_for_requested_loan', 0), 2)),
+            ('Maximum EMI Capacity', _rs(calculations.get('max_emi_allowed', 0), 2)),
+            ('Maximum Loan by Income', _rs(calculations.get('max_loan_by_income', 0), 2)),
+        ])
         pdf.ln(3)
         
         pdf.set_font('Arial', 'B', 12)
@@ -195,14 +390,14 @@ class ReportGenerator:
             pdf.cell(0, 10, 'ELIGIBLE FOR LOAN', 0, 1)
             approved_amount = calculations.get('approved_loan_amount', 0)
             pdf.set_font('Arial', 'B', 11)
-            pdf.cell(0, 7, f'Approved Amount: Rs{approved_amount:,.0f}', 0, 1)
+            pdf.cell(0, 7, f'Approved Amount: {_rs(approved_amount)}', 0, 1)
         else:
             pdf.set_text_color(255, 0, 0)
             pdf.cell(0, 10, 'NOT ELIGIBLE AS PER CURRENT NORMS', 0, 1)
             recommended = calculations.get('recommended_loan_amount', 0)
             if recommended > 0:
                 pdf.set_font('Arial', 'B', 11)
-                pdf.cell(0, 7, f'Recommended Amount: Rs{recommended:,.0f}', 0, 1)
+                pdf.cell(0, 7, f'Recommended Amount: {_rs(recommended)}', 0, 1)
         
         pdf.set_text_color(0, 0, 0)
         pdf.ln(3)
@@ -214,7 +409,7 @@ class ReportGenerator:
             pdf.set_text_color(0, 0, 0)
             pdf.set_font('Arial', '', 9)
             for issue in eligibility_results['issues']:
-                pdf.multi_cell(0, 5, f"  - {issue}")
+                pdf.fast_multi_cell(0, 5, f"  - {issue}")
         
         if eligibility_results.get('warnings'):
             pdf.set_font('Arial', 'B', 10)
@@ -223,7 +418,7 @@ class ReportGenerator:
             pdf.set_text_color(0, 0, 0)
             pdf.set_font('Arial', '', 9)
             for warning in eligibility_results['warnings']:
-                pdf.multi_cell(0, 5, f"  - {warning}")
+                pdf.fast_multi_cell(0, 5, f"  - {warning}")
         
         pdf.ln(5)
         
@@ -231,23 +426,18 @@ class ReportGenerator:
         
         if obligations and len(obligations) > 0:
             headers = ['Lender/Bank', 'Loan Type', 'Monthly EMI', 'Status']
-            data = []
-            total_emi = 0
-            
-            for obl in obligations:
-                lender = obl.get('lender', 'Unknown')
-                loan_type = obl.get('type', 'Unknown')
-                amount = obl.get('amount', 0)
-                excluded = obl.get('excluded', False)
-                has_doc = obl.get('has_loan_document', False)
-                
-                if not excluded:
-                    total_emi += amount
-                
-                status = 'Excluded' if excluded else 'Active'
-                data.append([lender, loan_type.title(), f"Rs{amount:,.2f}", status])
+            total_emi = sum(obl.get('amount', 0) for obl in obligations if not obl.get('excluded', False))
             
-            data.append(['', '', f"Rs{total_emi:,.2f}", 'TOTAL'])
+            data = [
+                [
+                    obl.get('lender', 'Unknown'),
+                    obl.get('type', 'Unknown').title(),
+                    _rs(obl.get('amount', 0), 2),
+                    'Excluded' if obl.get('excluded', False) else 'Active',
+                ]
+                for obl in obligations
+            ]
+            data.append(['', '', _rs(total_emi, 2), 'TOTAL'])
             
             pdf.add_table(headers, data, [60, 45, 40, 45])
         else:
@@ -255,21 +445,12 @@ class ReportGenerator:
             pdf.cell(0, 7, 'No existing loan obligations identified', 0, 1)
             pdf.ln(3)
         
-        pdf.add_field('Total Existing Obligations (considered)', f"Rs{calculations.get('total_existing_obligations', 0):,.2f} per month")
+        pdf.add_field('Total Existing Obligations (considered)', f"{_rs(calculations.get('total_existing_obligations', 0), 2)} per month")
         pdf.ln(5)
         
         pdf.section_title('5. PENDING DOCUMENTS')
         
-        pending_doc_list = pending_docs.get('pending_documents', [])
-        if pending_doc_list:
-            pdf.set_font('Arial', '', 10)
-            for i, doc in enumerate(pending_doc_list, 1):
-                pdf.multi_cell(0, 6, f"{i}. {doc}")
-        else:
-            pdf.set_font('Arial', 'B', 10)
-            pdf.set_text_color(0, 128, 0)
-            pdf.cell(0, 7, 'All mandatory documents uploaded', 0, 1)
-            pdf.set_text_color(0, 0, 0)
+        pdf._render_checklist(pending_docs.get('pending_documents', []), 'All mandatory documents uploaded')
         
         pdf.ln(3)
         pdf.add_field('Document Completion', f"{pending_docs.get('completion_percentage', 0)}%")
@@ -277,16 +458,7 @@ class ReportGenerator:
         
         pdf.section_title('6. PENDING FORM DETAILS')
         
-        pending_field_list = pending_forms.get('pending_form_fields', [])
-        if pending_field_list:
-            pdf.set_font('Arial', '', 10)
-            for i, field in enumerate(pending_field_list, 1):
-                pdf.multi_cell(0, 6, f"{i}. {field}")
-        else:
-            pdf.set_font('Arial', 'B', 10)
-            pdf.set_text_color(0, 128, 0)
-            pdf.cell(0, 7, 'All form details complete', 0, 1)
-            pdf.set_text_color(0, 0, 0)
+        pdf._render_checklist(pending_forms.get('pending_form_fields', []), 'All form details complete')
         
         pdf.ln(3)
         pdf.add_field('Form Completion', f"{pending_forms.get('completion_percentage', 0)}%")
@@ -294,16 +466,8 @@ class ReportGenerator:
         
         pdf.section_title('7. PROBABLE QUERIES')
         
-        if queries and len(queries) > 0:
-            pdf.set_font('Arial', '', 9)
-            for query in queries:
-                pdf.multi_cell(0, 5, query)
-                pdf.ln(1)
-        else:
-            pdf.set_font('Arial', 'B', 10)
-            pdf.set_text_color(0, 128, 0)
-            pdf.cell(0, 7, 'No queries identified. File appears complete.', 0, 1)
-            pdf.set_text_color(0, 0, 0)
+        pdf._render_checklist(queries, 'No queries identified. File appears complete.',
+                              numbered=False, font_size=9, line_h=5, spacing=1)
         
         pdf.ln(10)
         pdf.set_font('Arial', 'I', 8)